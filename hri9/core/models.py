@@ -7,7 +7,7 @@ with additional functionality for complex rule processing.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any, Union
+from typing import List, Dict, Optional, Any, Sequence, Union
 from datetime import datetime
 from enum import Enum
 import json
@@ -29,6 +29,13 @@ class FormType(Enum):
     UNKNOWN = "UNKNOWN"
 
 
+# Citizenship statuses that require work authorization document checks
+NON_CITIZEN_STATUSES = frozenset({
+    CitizenshipStatus.LAWFUL_PERMANENT_RESIDENT,
+    CitizenshipStatus.ALIEN_AUTHORIZED_TO_WORK
+})
+
+
 class ProcessingStatus(Enum):
     """Processing status enumeration"""
     COMPLETE_SUCCESS = "COMPLETE_SUCCESS"
@@ -179,10 +186,7 @@ class I9FormData:
     
     def is_non_citizen(self) -> bool:
         """Check if employee is non-citizen"""
-        return self.citizenship_status in [
-            CitizenshipStatus.LAWFUL_PERMANENT_RESIDENT,
-            CitizenshipStatus.ALIEN_AUTHORIZED_TO_WORK
-        ]
+        return self.citizenship_status in NON_CITIZEN_STATUSES
     
     def get_primary_documents(self) -> List[DocumentInfo]:
         """Get primary documents based on form type"""
@@ -225,7 +229,7 @@ class ScenarioResult:
     status: ProcessingStatus
     primary_form: Optional[I9FormData]
     supporting_documents: List[DocumentInfo] = field(default_factory=list)
-    validation_results: List[ValidationResult] = field(default_factory=list)
+    validation_results: Sequence[ValidationResult] = field(default_factory=list)
     date_matches: Dict[str, bool] = field(default_factory=dict)
     attachment_status: Dict[str, bool] = field(default_factory=dict)
     notes: str = ""
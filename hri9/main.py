@@ -963,33 +963,37 @@ def process_all_employees_data_only(employee_ids: list, workers: int = 4, use_lo
     processed_count = 0
     success_count = 0
     
-    with ThreadPoolExecutor(max_workers=workers) as executor:
-        # Submit all tasks
-        futures = [
-            executor.submit(process_single_document_data_only, employee_id, enhanced_processor, categorized_reporter, use_local)
-            for employee_id in employee_ids
-        ]
-        
-        # Process results as they complete
-        for i, future in enumerate(as_completed(futures)):
-            try:
-                success = future.result()
-                processed_count += 1
-                if success:
-                    success_count += 1
-                
-                # Progress reporting
-                progress = (i + 1) / len(employee_ids) * 100
-                elapsed = time.time() - start_time
-                rate = processed_count / elapsed if elapsed > 0 else 0
-                eta = (len(employee_ids) - processed_count) / rate if rate > 0 else 0
-                
-                logger.info(f"Progress: {i+1}/{len(employee_ids)} ({progress:.1f}%) | "
-                           f"Success: {success_count} | Rate: {rate:.2f} docs/sec | ETA: {eta:.1f}s")
-                
-            except Exception as e:
-                logger.error(f"Future execution error: {e}")
-                processed_count += 1
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Submit all tasks
+            futures = [
+                executor.submit(process_single_document_data_only, employee_id, enhanced_processor, categorized_reporter, use_local)
+                for employee_id in employee_ids
+            ]
+            
+            # Process results as they complete
+            for i, future in enumerate(as_completed(futures)):
+                try:
+                    success = future.result()
+                    processed_count += 1
+                    if success:
+                        success_count += 1
+                    
+                    # Progress reporting
+                    progress = (i + 1) / len(employee_ids) * 100
+                    elapsed = time.time() - start_time
+                    rate = processed_count / elapsed if elapsed > 0 else 0
+                    eta = (len(employee_ids) - processed_count) / rate if rate > 0 else 0
+                    
+                    logger.info(f"Progress: {i+1}/{len(employee_ids)} ({progress:.1f}%) | "
+                               f"Success: {success_count} | Rate: {rate:.2f} docs/sec | ETA: {eta:.1f}s")
+                    
+                except Exception as e:
+                    logger.error(f"Future execution error: {e}")
+                    processed_count += 1
+    finally:
+        # Close the category files even if the run is interrupted
+        categorized_reporter.close()
     
     # Finalize reporting
     processing_time = time.time() - start_time
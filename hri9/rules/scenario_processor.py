@@ -6,9 +6,9 @@ This module implements the 5 specific business rule scenarios for I-9 processing
 as defined in the requirements.
 """
 
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, Optional, Sequence, Tuple, Any
 from datetime import datetime
-import re
+from functools import lru_cache
 
 from ..utils.logging_config import logger
 from ..core.models import (
@@ -18,6 +18,20 @@ from ..core.models import (
 from .rule_engine import Rule, RuleContext, RuleResult, RuleStatus, RuleSeverity
 
 
+# Separators ignored when comparing date strings (slashes, dashes and whitespace)
+_DATE_SEPARATORS = str.maketrans('', '', '/- \t\r\n\f\v')
+
+
+@lru_cache(maxsize=1024)
+def _dates_match(date1: str, date2: str) -> bool:
+    """Check if two date strings match (with some tolerance for formatting)"""
+    if not date1 or not date2:
+        return False
+    
+    # Normalize dates by removing common separators and spaces
+    return date1.translate(_DATE_SEPARATORS) == date2.translate(_DATE_SEPARATORS)
+
+
 class ScenarioProcessor:
     """Processes I-9 documents according to specific business rule scenarios"""
     
@@ -34,17 +48,22 @@ class ScenarioProcessor:
         Returns:
             List of scenario results
         """
-        results = []
-        
-        if not pdf_analysis.form_selection_result:
+        form_selection_result = pdf_analysis.form_selection_result
+        if not form_selection_result:
             return [self._create_no_forms_result()]
         
-        forms = pdf_analysis.form_selection_result.all_detected_forms
-        selected_form = pdf_analysis.form_selection_result.selected_form
+        forms = form_selection_result.all_detected_forms
+        if not forms:
+            return [self._create_no_applicable_scenarios_result()]
+        
+        selected_form = form_selection_result.selected_form
         
         # Determine which scenarios apply
         applicable_scenarios = self._determine_applicable_scenarios(forms, pdf_analysis)
+        if not applicable_scenarios:
+            return [self._create_no_applicable_scenarios_result()]
         
+        results = []
         for scenario_id in applicable_scenarios:
             if scenario_id == "scenario_1":
                 result = self._process_scenario_1(selected_form, pdf_analysis)
@@ -113,12 +132,9 @@ class ScenarioProcessor:
             primary_form=form
         )
         
-        # Extract basic information
-        validation_results = []
-        
         # Validate basic employee information
         basic_info_validation = self._validate_basic_employee_info(form)
-        validation_results.append(basic_info_validation)
+        date_match_validation = None
         
         # Get supporting documents from Section 2
         supporting_docs = form.section_2_documents
@@ -126,10 +142,12 @@ class ScenarioProcessor:
         
         # Check alien expiration date matching (if non-citizen)
         if form.is_non_citizen():
-            date_match_validation = self._validate_alien_expiration_date_match(form, supporting_docs)
-            validation_results.append(date_match_validation)
-            
+            # Resolve the expiration date once and share it with the validator
             alien_expiration = form.get_alien_expiration_date()
+            date_match_validation = self._validate_alien_expiration_date_match(
+                form, supporting_docs, alien_expiration
+            )
+            
             if alien_expiration:
                 scenario_result.date_matches["alien_expiration"] = self._check_date_matches_documents(
                     alien_expiration, supporting_docs
@@ -137,19 +155,19 @@ class ScenarioProcessor:
         
         # Check document attachments
         attachment_validation = self._validate_document_attachments(supporting_docs, pdf_analysis)
-        validation_results.append(attachment_validation)
         
         # Update attachment status
         for doc in supporting_docs:
             scenario_result.attachment_status[doc.document_type] = doc.is_attached
         
+        if date_match_validation is None:
+            validation_results = (basic_info_validation, attachment_validation)
+        else:
+            validation_results = (basic_info_validation, date_match_validation, attachment_validation)
         scenario_result.validation_results = validation_results
         
         # Determine overall status
-        if any(not v.is_valid and v.severity == "critical" for v in validation_results):
-            scenario_result.status = ProcessingStatus.ERROR
-        elif any(not v.is_valid for v in validation_results):
-            scenario_result.status = ProcessingStatus.PARTIAL_SUCCESS
+        scenario_result.status = self._derive_status(validation_results)
         
         return scenario_result
     
@@ -230,28 +248,25 @@ class ScenarioProcessor:
         supporting_docs = latest_supplement_b.supplement_b_documents
         scenario_result.supporting_documents = supporting_docs
         
-        validation_results = []
-        
         # Validate basic info (should come from associated Section 1)
         basic_info_validation = self._validate_basic_employee_info(latest_supplement_b)
-        validation_results.append(basic_info_validation)
-        
-        # Check alien expiration date with Supplement B documents
-        if latest_supplement_b.is_non_citizen():
-            date_match_validation = self._validate_alien_expiration_date_match(latest_supplement_b, supporting_docs)
-            validation_results.append(date_match_validation)
         
         # Check Supplement B document attachments
         attachment_validation = self._validate_document_attachments(supporting_docs, pdf_analysis)
-        validation_results.append(attachment_validation)
+        
+        # Check alien expiration date with Supplement B documents
+        if latest_supplement_b.is_non_citizen():
+            date_match_validation = self._validate_alien_expiration_date_match(
+                latest_supplement_b, supporting_docs, latest_supplement_b.get_alien_expiration_date()
+            )
+            validation_results = (basic_info_validation, date_match_validation, attachment_validation)
+        else:
+            validation_results = (basic_info_validation, attachment_validation)
         
         scenario_result.validation_results = validation_results
         
         # Determine status
-        if any(not v.is_valid and v.severity == "critical" for v in validation_results):
-            scenario_result.status = ProcessingStatus.ERROR
-        elif any(not v.is_valid for v in validation_results):
-            scenario_result.status = ProcessingStatus.PARTIAL_SUCCESS
+        scenario_result.status = self._derive_status(validation_results)
         
         return scenario_result
     
@@ -282,13 +297,11 @@ class ScenarioProcessor:
             primary_form=latest_section_3
         )
         
-        validation_results = []
-        
         # Check if Section 1 exists before Section 3
         section_1_validation = self._validate_section_1_before_section_3(
             latest_section_3, forms, pdf_analysis
         )
-        validation_results.append(section_1_validation)
+        validation_results = (section_1_validation,)
         
         # If Section 1 found, get primary details from it
         if section_1_validation.is_valid:
@@ -296,21 +309,25 @@ class ScenarioProcessor:
             if section_1_form:
                 # Use Section 1 for basic info, Section 3 for documents
                 basic_info_validation = self._validate_basic_employee_info(section_1_form)
-                validation_results.append(basic_info_validation)
                 
                 # Check alien date with Section 3 documents
                 section_3_docs = latest_section_3.section_3_documents
                 scenario_result.supporting_documents = section_3_docs
                 
+                date_match_validation = None
                 if section_1_form.is_non_citizen():
                     date_match_validation = self._validate_alien_expiration_date_match(
-                        section_1_form, section_3_docs
+                        section_1_form, section_3_docs, section_1_form.get_alien_expiration_date()
                     )
-                    validation_results.append(date_match_validation)
                 
                 # Check Section 3 document attachments
                 attachment_validation = self._validate_document_attachments(section_3_docs, pdf_analysis)
-                validation_results.append(attachment_validation)
+                
+                if date_match_validation is None:
+                    validation_results = (section_1_validation, basic_info_validation, attachment_validation)
+                else:
+                    validation_results = (section_1_validation, basic_info_validation,
+                                          date_match_validation, attachment_validation)
         else:
             # Section 1 not found - log this as required
             scenario_result.status = ProcessingStatus.SECTION_1_NOT_FOUND
@@ -322,6 +339,17 @@ class ScenarioProcessor:
     
     # Helper methods for validation
     
+    @staticmethod
+    def _derive_status(validation_results: Sequence[ValidationResult]) -> ProcessingStatus:
+        """Derive scenario status from its validation results in a single pass"""
+        status = ProcessingStatus.COMPLETE_SUCCESS
+        for v in validation_results:
+            if not v.is_valid:
+                if v.severity == "critical":
+                    return ProcessingStatus.ERROR
+                status = ProcessingStatus.PARTIAL_SUCCESS
+        return status
+    
     def _validate_basic_employee_info(self, form: I9FormData) -> ValidationResult:
         """Validate basic employee information completeness"""
         missing_fields = []
@@ -348,10 +376,17 @@ class ScenarioProcessor:
             severity=severity
         )
     
-    def _validate_alien_expiration_date_match(self, form: I9FormData, documents: List[DocumentInfo]) -> ValidationResult:
-        """Validate that alien expiration date matches supporting document expiration dates"""
+    def _validate_alien_expiration_date_match(self, form: I9FormData, documents: List[DocumentInfo],
+                                              alien_expiration: Optional[str] = None) -> ValidationResult:
+        """
+        Validate that alien expiration date matches supporting document expiration dates
+        
+        Callers that already resolved the form's alien expiration date can pass it
+        in to avoid looking it up again.
+        """
         
-        alien_expiration = form.get_alien_expiration_date()
+        if alien_expiration is None:
+            alien_expiration = form.get_alien_expiration_date()
         
         if not alien_expiration or alien_expiration == "Not visible":
             return ValidationResult(
@@ -365,7 +400,7 @@ class ScenarioProcessor:
         matching_docs = []
         for doc in documents:
             if doc.expiration_date and doc.expiration_date != "Not visible":
-                if self._dates_match(alien_expiration, doc.expiration_date):
+                if _dates_match(alien_expiration, doc.expiration_date):
                     matching_docs.append(doc.document_type)
         
         is_valid = len(matching_docs) > 0
@@ -466,20 +501,13 @@ class ScenarioProcessor:
         """Check if target date matches any document expiration date"""
         for doc in documents:
             if doc.expiration_date and doc.expiration_date != "Not visible":
-                if self._dates_match(target_date, doc.expiration_date):
+                if _dates_match(target_date, doc.expiration_date):
                     return True
         return False
     
     def _dates_match(self, date1: str, date2: str) -> bool:
         """Check if two date strings match (with some tolerance for formatting)"""
-        if not date1 or not date2:
-            return False
-        
-        # Normalize dates by removing common separators and spaces
-        norm_date1 = re.sub(r'[/-\s]', '', date1.strip())
-        norm_date2 = re.sub(r'[/-\s]', '', date2.strip())
-        
-        return norm_date1 == norm_date2
+        return _dates_match(date1, date2)
     
     def _create_no_forms_result(self) -> ScenarioResult:
         """Create result when no forms are found"""
@@ -4,15 +4,195 @@ Business Rules Reporter
 This module handles the generation and export of business rules processing reports.
 """
 
+import gzip
 import json
+import operator
 import os
+from collections import Counter
+from functools import lru_cache
+from sys import intern
+from statistics import fmean
+from dataclasses import dataclass, fields, is_dataclass
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from enum import Enum
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Any, Optional
 from pathlib import Path
 
 from hri9.core.models import ProcessingResult, ScenarioResult
 from hri9.config.settings import BUSINESS_RULES_OUTPUT_DIR
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
+
+@dataclass
+class ValidationRow:
+    """Single validation entry in a business rules report"""
+    __slots__ = ('rule_name', 'is_valid', 'severity', 'message', 'details')
+    rule_name: str
+    is_valid: bool
+    severity: str
+    message: str
+    details: Dict[str, Any]
+
+
+def _json_default(obj: Any) -> Any:
+    """Fallback serializer for the stdlib json path (orjson handles these natively)"""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Per-scenario block of the text report; notes_line is empty or a complete "  Notes: ..." line
+_SCENARIO_TEMPLATE = (
+    "Scenario: {name}\n"
+    "  Status: {status}\n"
+    "  Critical Issues: {critical}\n"
+    "  Validations: {validations}\n"
+    "{notes_line}"
+    "\n"
+)
+
+
+_RULE_HEAVY = "=" * 80
+_RULE_LIGHT = "-" * 40
+
+# Full text report layout, rendered with str.format_map in _write_text_report
+_TEXT_REPORT_TEMPLATE = (
+    f"{_RULE_HEAVY}\n"
+    "BUSINESS RULES PROCESSING REPORT\n"
+    f"{_RULE_HEAVY}\n\n"
+    "Employee ID: {employee_id}\n"
+    "PDF File: {pdf_filename}\n"
+    "Report Generated: {report_timestamp}\n"
+    "Processing Status: {processing_status}\n\n"
+    "PROCESSING SUMMARY\n"
+    f"{_RULE_LIGHT}\n"
+    "Scenarios Processed: {total_scenarios_processed}\n"
+    "Total Validations: {total_validations}\n"
+    "Passed Validations: {passed_validations}\n"
+    "Failed Validations: {failed_validations}\n"
+    "Critical Issues: {critical_issues}\n"
+    "Success Rate: {validation_success_rate:.1f}%\n\n"
+    "SCENARIO RESULTS\n"
+    f"{_RULE_LIGHT}\n"
+    "{scenarios}"
+    "RECOMMENDATIONS\n"
+    f"{_RULE_LIGHT}\n"
+    "{recommendations}\n"
+    "NEXT STEPS\n"
+    f"{_RULE_LIGHT}\n"
+    "{next_steps}\n"
+    f"{_RULE_HEAVY}\n"
+    "END OF REPORT\n"
+    f"{_RULE_HEAVY}\n"
+)
+
+# Columns pulled from each report's processing_summary by generate_summary_report
+_PROCESSING_SUMMARY = operator.itemgetter("processing_summary")
+_SUMMARY_COLUMNS = operator.itemgetter(
+    "total_scenarios_processed", "total_validations", "passed_validations",
+    "failed_validations", "critical_issues", "validation_success_rate", "overall_status"
+)
+
+
+# Report file path prefix; settings creates BUSINESS_RULES_OUTPUT_DIR at import time
+_REPORT_PATH_PREFIX = os.path.join(BUSINESS_RULES_OUTPUT_DIR, "business_rules_")
+
+# Recommendation messages emitted by _generate_recommendations
+_REC_CRITICAL = "CRITICAL: Address critical validation failures before proceeding"
+_REC_FAILED_MAJORITY = "Review and correct failed validations to improve compliance"
+_REC_LOW_SUCCESS_RATE = "Low validation success rate - manual review recommended"
+_REC_NO_I9 = "No I-9 form detected - verify document contains valid I-9 forms"
+_REC_NO_SCENARIOS = "No applicable scenarios found - review document structure"
+_REC_ALL_CLEAR = "Processing completed successfully - no immediate action required"
+
+
+@lru_cache(maxsize=64)
+def _recommendations_for_shape(has_critical_issues: bool, mostly_failed: bool, low_success_rate: bool,
+                               missing_i9: bool, missing_scenarios: bool) -> tuple:
+    """Recommendations for a result outcome shape; the five flags admit only 32 shapes"""
+    recommendations = []
+    
+    if has_critical_issues:
+        recommendations.append(_REC_CRITICAL)
+    
+    if mostly_failed:
+        recommendations.append(_REC_FAILED_MAJORITY)
+    
+    if low_success_rate:
+        recommendations.append(_REC_LOW_SUCCESS_RATE)
+    
+    if missing_i9:
+        recommendations.append(_REC_NO_I9)
+    
+    if missing_scenarios:
+        recommendations.append(_REC_NO_SCENARIOS)
+    
+    if not recommendations:
+        recommendations.append(_REC_ALL_CLEAR)
+    
+    return tuple(recommendations)
+
+
+# Next steps keyed by overall processing status value
+_NEXT_STEPS: Dict[str, tuple] = {
+    "ERROR": (
+        "1. Review error details and processing logs",
+        "2. Verify document quality and format",
+        "3. Consider manual processing if automated processing fails"
+    ),
+    "PARTIAL_SUCCESS": (
+        "1. Review validation failures and warnings",
+        "2. Correct identified issues if possible",
+        "3. Proceed with caution for critical business processes"
+    ),
+    "COMPLETE_SUCCESS": (
+        "1. Document is ready for business use",
+        "2. Archive processed results",
+        "3. Update employee records as needed"
+    )
+}
+_DEFAULT_NEXT_STEPS = ("1. Review processing status and take appropriate action",)
+
+
+# gzip level for 'json.gz' reports; level 1 keeps compression cost near zero while the
+# repetitive field names still compress several-fold
+_GZIP_COMPRESSLEVEL = 1
+
+
+def _serialize_report_json(report: Dict[str, Any]) -> bytes:
+    """Serialize a report to indented UTF-8 JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(report, indent=2, ensure_ascii=False, default=_json_default).encode('utf-8')
+
+
+# validation_type -> validation_summary bucket, filled lazily as rule names are seen
+_CATEGORY_CACHE: Dict[str, str] = {}
+
+
+def _categorize(validation_type: str) -> str:
+    """Return the validation_summary bucket for a validation type"""
+    category = _CATEGORY_CACHE.get(validation_type)
+    if category is None:
+        validation_type_lower = validation_type.lower()
+        if "field" in validation_type_lower:
+            category = "field_validations"
+        elif "document" in validation_type_lower:
+            category = "document_validations"
+        elif "compliance" in validation_type_lower:
+            category = "compliance_validations"
+        else:
+            category = "cross_field_validations"
+        _CATEGORY_CACHE[validation_type] = category
+    return category
+
 
 class BusinessRulesReporter:
     """Generate comprehensive business rules reports"""
@@ -33,13 +213,15 @@ class BusinessRulesReporter:
             Dictionary containing the complete business rules report
         """
         
+        status_value = processing_result.status.value
+        
         report = {
             "report_metadata": {
                 "employee_id": employee_id,
                 "pdf_filename": pdf_filename,
                 "report_timestamp": datetime.now().isoformat(),
                 "report_version": "1.0",
-                "processing_status": processing_result.status.value
+                "processing_status": status_value
             },
             "processing_summary": {
                 "total_scenarios_processed": len(processing_result.scenario_results),
@@ -48,7 +230,7 @@ class BusinessRulesReporter:
                 "failed_validations": processing_result.failed_validations,
                 "critical_issues": processing_result.critical_issues,
                 "validation_success_rate": processing_result.validation_success_rate,
-                "overall_status": processing_result.status.value
+                "overall_status": status_value
             },
             "scenario_results": [],
             "validation_summary": {
@@ -67,8 +249,12 @@ class BusinessRulesReporter:
             "next_steps": []
         }
         
+        # validation_summary buckets hold [scenario_index, validation_index] references
+        # into scenario_results rather than a second copy of each validation entry
+        validation_summary = report["validation_summary"]
+        
         # Process scenario results
-        for scenario in processing_result.scenario_results:
+        for scenario_index, scenario in enumerate(processing_result.scenario_results):
             scenario_data = {
                 "scenario_name": scenario.scenario_name,
                 "scenario_id": getattr(scenario, 'scenario_id', 'unknown'),
@@ -79,26 +265,23 @@ class BusinessRulesReporter:
                 "processing_time": getattr(scenario, 'processing_time', 0.0)
             }
             
-            # Add validation results for this scenario
-            for validation in scenario.validation_results:
-                validation_data = {
-                    "rule_name": validation.validation_type,
-                    "is_valid": validation.is_valid,
-                    "severity": validation.severity,
-                    "message": validation.message,
-                    "details": validation.details
-                }
+            # Add validation results for this scenario. Rule names and severities come
+            # from a small vocabulary, so intern them to share one string object each.
+            for validation_index, validation in enumerate(scenario.validation_results):
+                validation_type = intern(validation.validation_type)
+                validation_data = ValidationRow(
+                    validation_type,
+                    validation.is_valid,
+                    intern(validation.severity),
+                    validation.message,
+                    validation.details
+                )
                 scenario_data["validation_results"].append(validation_data)
                 
                 # Categorize validations
-                if "field" in validation.validation_type.lower():
-                    report["validation_summary"]["field_validations"].append(validation_data)
-                elif "document" in validation.validation_type.lower():
-                    report["validation_summary"]["document_validations"].append(validation_data)
-                elif "compliance" in validation.validation_type.lower():
-                    report["validation_summary"]["compliance_validations"].append(validation_data)
-                else:
-                    report["validation_summary"]["cross_field_validations"].append(validation_data)
+                validation_summary[_categorize(validation_type)].append(
+                    [scenario_index, validation_index]
+                )
             
             report["scenario_results"].append(scenario_data)
         
@@ -108,58 +291,39 @@ class BusinessRulesReporter:
         
         return report
     
+    @staticmethod
+    def get_categorized_validations(report: Dict[str, Any], category: str) -> List[Any]:
+        """
+        Resolve a validation_summary bucket to its validation entries.
+        
+        Args:
+            report: Business rules report dictionary
+            category: Bucket name, e.g. 'field_validations' or 'document_validations'
+            
+        Returns:
+            List of validation entries from scenario_results in that category
+        """
+        scenario_results = report["scenario_results"]
+        return [
+            scenario_results[scenario_index]["validation_results"][validation_index]
+            for scenario_index, validation_index in report["validation_summary"][category]
+        ]
+    
     @staticmethod
     def _generate_recommendations(processing_result: ProcessingResult) -> List[str]:
         """Generate actionable recommendations based on processing results"""
-        recommendations = []
-        
-        if processing_result.critical_issues > 0:
-            recommendations.append("CRITICAL: Address critical validation failures before proceeding")
-        
-        if processing_result.failed_validations > processing_result.passed_validations:
-            recommendations.append("Review and correct failed validations to improve compliance")
-        
-        if processing_result.validation_success_rate < 50.0:
-            recommendations.append("Low validation success rate - manual review recommended")
-        
-        if not processing_result.primary_i9_data:
-            recommendations.append("No I-9 form detected - verify document contains valid I-9 forms")
-        
-        if len(processing_result.scenario_results) == 0:
-            recommendations.append("No applicable scenarios found - review document structure")
-        
-        if not recommendations:
-            recommendations.append("Processing completed successfully - no immediate action required")
-        
-        return recommendations
+        return list(_recommendations_for_shape(
+            processing_result.critical_issues > 0,
+            processing_result.failed_validations > processing_result.passed_validations,
+            processing_result.validation_success_rate < 50.0,
+            not processing_result.primary_i9_data,
+            not processing_result.scenario_results
+        ))
     
     @staticmethod
     def _generate_next_steps(processing_result: ProcessingResult) -> List[str]:
         """Generate next steps based on processing results"""
-        next_steps = []
-        
-        if processing_result.status.value == "ERROR":
-            next_steps.extend([
-                "1. Review error details and processing logs",
-                "2. Verify document quality and format",
-                "3. Consider manual processing if automated processing fails"
-            ])
-        elif processing_result.status.value == "PARTIAL_SUCCESS":
-            next_steps.extend([
-                "1. Review validation failures and warnings",
-                "2. Correct identified issues if possible",
-                "3. Proceed with caution for critical business processes"
-            ])
-        elif processing_result.status.value == "COMPLETE_SUCCESS":
-            next_steps.extend([
-                "1. Document is ready for business use",
-                "2. Archive processed results",
-                "3. Update employee records as needed"
-            ])
-        else:
-            next_steps.append("1. Review processing status and take appropriate action")
-        
-        return next_steps
+        return list(_NEXT_STEPS.get(processing_result.status.value, _DEFAULT_NEXT_STEPS))
     
     @staticmethod
     def save_business_rules_report(report: Dict[str, Any], 
@@ -171,29 +335,35 @@ class BusinessRulesReporter:
         Args:
             report: Business rules report dictionary
             employee_id: Employee identifier for filename
-            output_format: Output format ('json' or 'txt')
+            output_format: Output format ('json', 'json.gz' or 'txt')
             
         Returns:
             Path to saved file, or None if save failed
         """
         
         try:
-            # Ensure output directory exists
-            os.makedirs(BUSINESS_RULES_OUTPUT_DIR, exist_ok=True)
-            
             # Generate filename with timestamp
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            file_stem = f"{_REPORT_PATH_PREFIX}{employee_id}_{timestamp}"
+            output_format = output_format.lower()
             
-            if output_format.lower() == "json":
-                filename = f"business_rules_{employee_id}_{timestamp}.json"
-                filepath = os.path.join(BUSINESS_RULES_OUTPUT_DIR, filename)
+            if output_format == "json":
+                filepath = f"{file_stem}.json"
                 
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump(report, f, indent=2, ensure_ascii=False)
+                # Serialize up front so the report goes out in a single write
+                data = _serialize_report_json(report)
+                with open(filepath, 'wb') as f:
+                    f.write(data)
+                
+            elif output_format == "json.gz":
+                filepath = f"{file_stem}.json.gz"
+                
+                data = _serialize_report_json(report)
+                with gzip.open(filepath, 'wb', compresslevel=_GZIP_COMPRESSLEVEL) as f:
+                    f.write(data)
                     
-            elif output_format.lower() == "txt":
-                filename = f"business_rules_{employee_id}_{timestamp}.txt"
-                filepath = os.path.join(BUSINESS_RULES_OUTPUT_DIR, filename)
+            elif output_format == "txt":
+                filepath = f"{file_stem}.txt"
                 
                 with open(filepath, 'w', encoding='utf-8') as f:
                     BusinessRulesReporter._write_text_report(f, report)
@@ -210,69 +380,94 @@ class BusinessRulesReporter:
     def _write_text_report(file_handle, report: Dict[str, Any]):
         """Write a human-readable text report"""
         
-        # Header
-        file_handle.write("=" * 80 + "\n")
-        file_handle.write("BUSINESS RULES PROCESSING REPORT\n")
-        file_handle.write("=" * 80 + "\n\n")
-        
-        # Metadata
         metadata = report["report_metadata"]
-        file_handle.write(f"Employee ID: {metadata['employee_id']}\n")
-        file_handle.write(f"PDF File: {metadata['pdf_filename']}\n")
-        file_handle.write(f"Report Generated: {metadata['report_timestamp']}\n")
-        file_handle.write(f"Processing Status: {metadata['processing_status']}\n\n")
-        
-        # Processing Summary
         summary = report["processing_summary"]
-        file_handle.write("PROCESSING SUMMARY\n")
-        file_handle.write("-" * 40 + "\n")
-        file_handle.write(f"Scenarios Processed: {summary['total_scenarios_processed']}\n")
-        file_handle.write(f"Total Validations: {summary['total_validations']}\n")
-        file_handle.write(f"Passed Validations: {summary['passed_validations']}\n")
-        file_handle.write(f"Failed Validations: {summary['failed_validations']}\n")
-        file_handle.write(f"Critical Issues: {summary['critical_issues']}\n")
-        file_handle.write(f"Success Rate: {summary['validation_success_rate']:.1f}%\n\n")
+        scenario_template = _SCENARIO_TEMPLATE
         
-        # Scenario Results
-        file_handle.write("SCENARIO RESULTS\n")
-        file_handle.write("-" * 40 + "\n")
-        for scenario in report["scenario_results"]:
-            file_handle.write(f"Scenario: {scenario['scenario_name']}\n")
-            file_handle.write(f"  Status: {scenario['status']}\n")
-            file_handle.write(f"  Critical Issues: {scenario['has_critical_issues']}\n")
-            file_handle.write(f"  Validations: {len(scenario['validation_results'])}\n")
-            if scenario['notes']:
-                file_handle.write(f"  Notes: {scenario['notes']}\n")
-            file_handle.write("\n")
+        context = {
+            "employee_id": metadata['employee_id'],
+            "pdf_filename": metadata['pdf_filename'],
+            "report_timestamp": metadata['report_timestamp'],
+            "processing_status": metadata['processing_status'],
+            "total_scenarios_processed": summary['total_scenarios_processed'],
+            "total_validations": summary['total_validations'],
+            "passed_validations": summary['passed_validations'],
+            "failed_validations": summary['failed_validations'],
+            "critical_issues": summary['critical_issues'],
+            "validation_success_rate": summary['validation_success_rate'],
+            "scenarios": "".join(
+                scenario_template.format(
+                    name=scenario['scenario_name'],
+                    status=scenario['status'],
+                    critical=scenario['has_critical_issues'],
+                    validations=len(scenario['validation_results']),
+                    notes_line=f"  Notes: {scenario['notes']}\n" if scenario['notes'] else ""
+                )
+                for scenario in report["scenario_results"]
+            ),
+            "recommendations": "".join(
+                f"{i}. {rec}\n" for i, rec in enumerate(report["recommendations"], 1)
+            ),
+            "next_steps": "".join(f"{step}\n" for step in report["next_steps"]),
+        }
         
-        # Recommendations
-        file_handle.write("RECOMMENDATIONS\n")
-        file_handle.write("-" * 40 + "\n")
-        for i, rec in enumerate(report["recommendations"], 1):
-            file_handle.write(f"{i}. {rec}\n")
-        file_handle.write("\n")
+        file_handle.write(_TEXT_REPORT_TEMPLATE.format_map(context))
+    
+    @staticmethod
+    def save_business_rules_report_jsonl(report: Dict[str, Any], file_handle: BinaryIO) -> None:
+        """
+        Append a report as a single JSON line to an open binary file.
         
-        # Next Steps
-        file_handle.write("NEXT STEPS\n")
-        file_handle.write("-" * 40 + "\n")
-        for step in report["next_steps"]:
-            file_handle.write(f"{step}\n")
-        file_handle.write("\n")
+        Writing every report of a batch to one shared .jsonl file lets the summary
+        be aggregated by streaming it back with generate_summary_report_from_jsonl,
+        instead of holding every report in memory.
         
-        file_handle.write("=" * 80 + "\n")
-        file_handle.write("END OF REPORT\n")
-        file_handle.write("=" * 80 + "\n")
+        Args:
+            report: Business rules report dictionary
+            file_handle: File opened in binary append/write mode
+        """
+        if orjson is not None:
+            line = orjson.dumps(report, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+        else:
+            line = (json.dumps(report, ensure_ascii=False, default=_json_default) + "\n").encode('utf-8')
+        file_handle.write(line)
+    
+    @staticmethod
+    def iter_reports_jsonl(jsonl_path: str) -> Iterator[Dict[str, Any]]:
+        """Yield reports one at a time from a JSON Lines file"""
+        loads = orjson.loads if orjson is not None else json.loads
+        with open(jsonl_path, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield loads(line)
+    
+    @staticmethod
+    def generate_summary_report_from_jsonl(jsonl_path: str) -> Dict[str, Any]:
+        """Generate a summary report by streaming reports from a JSON Lines file"""
+        return BusinessRulesReporter.generate_summary_report(
+            BusinessRulesReporter.iter_reports_jsonl(jsonl_path)
+        )
     
     @staticmethod
-    def generate_summary_report(all_reports: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Generate a summary report across multiple employee documents"""
+    def generate_summary_report(all_reports: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Generate a summary report across multiple employee documents.
+        
+        all_reports may be any iterable, including a generator; only the summary
+        columns of each report are retained while it is consumed.
+        """
         
-        if not all_reports:
+        # Aggregate statistics column-wise in a single pass driven entirely by C-level map/zip
+        columns = list(zip(*map(_SUMMARY_COLUMNS, map(_PROCESSING_SUMMARY, all_reports))))
+        if not columns:
             return {"error": "No reports provided"}
         
+        (scenarios, validations, passed, failed, critical,
+         success_rates, statuses) = columns
+        
         summary = {
             "summary_metadata": {
-                "total_documents": len(all_reports),
+                "total_documents": len(statuses),
                 "report_timestamp": datetime.now().isoformat(),
                 "report_version": "1.0"
             },
@@ -289,27 +484,16 @@ class BusinessRulesReporter:
             "recommendations": []
         }
         
-        # Aggregate statistics
-        success_rates = []
-        status_counts = {}
-        
-        for report in all_reports:
-            proc_summary = report["processing_summary"]
-            summary["aggregate_statistics"]["total_scenarios"] += proc_summary["total_scenarios_processed"]
-            summary["aggregate_statistics"]["total_validations"] += proc_summary["total_validations"]
-            summary["aggregate_statistics"]["total_passed"] += proc_summary["passed_validations"]
-            summary["aggregate_statistics"]["total_failed"] += proc_summary["failed_validations"]
-            summary["aggregate_statistics"]["total_critical_issues"] += proc_summary["critical_issues"]
-            
-            success_rates.append(proc_summary["validation_success_rate"])
-            
-            status = proc_summary["overall_status"]
-            status_counts[status] = status_counts.get(status, 0) + 1
+        aggregate = summary["aggregate_statistics"]
+        aggregate["total_scenarios"] = sum(scenarios)
+        aggregate["total_validations"] = sum(validations)
+        aggregate["total_passed"] = sum(passed)
+        aggregate["total_failed"] = sum(failed)
+        aggregate["total_critical_issues"] = sum(critical)
         
-        # Calculate averages
-        if success_rates:
-            summary["aggregate_statistics"]["average_success_rate"] = sum(success_rates) / len(success_rates)
+        # Calculate averages (at least one report was seen, so success_rates is non-empty)
+        aggregate["average_success_rate"] = fmean(success_rates)
         
-        summary["status_distribution"] = status_counts
+        summary["status_distribution"] = dict(Counter(statuses))
         
         return summary
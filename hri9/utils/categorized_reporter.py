@@ -10,6 +10,8 @@ This module creates separate output files for different processing result catego
 
 import os
 import csv
+import operator
+import threading
 from typing import Dict, List, Any
 from pathlib import Path
 from datetime import datetime
@@ -17,6 +19,20 @@ from datetime import datetime
 from .logging_config import logger
 
 
+# ProcessingResult attributes copied into each CSV row, fetched in one C-level call
+_PROCESSING_RESULT_ATTRS = operator.attrgetter(
+    'total_forms_detected', 'form_type_selected', 'selection_reason', 'notes',
+    'document_matches_found', 'supporting_documents_count', 'expiration_matches',
+    'documents_mentioned_count', 'documents_attached_count', 'documents_missing_count',
+    'document_attachment_status'
+)
+
+# I-9 form attributes copied into each CSV row
+_I9_ROW_ATTRS = operator.attrgetter(
+    'first_name', 'last_name', 'citizenship_status', 'employee_signature_date'
+)
+
+
 class CategorizedReporter:
     """Creates categorized output files based on processing results"""
     
@@ -52,6 +68,13 @@ class CategorizedReporter:
         # Initialize CSV files
         self._initialize_csv_files()
         
+        # Keep one handle and writer per category file open until finalize()
+        self._handles = {}
+        self._writers = {}
+        for file_path in (self.success_file, self.partial_file, self.error_file):
+            self._open_handle(file_path)
+        self._rows_lock = threading.Lock()
+        
         # Counters
         self.success_count = 0
         self.partial_count = 0
@@ -59,6 +82,13 @@ class CategorizedReporter:
         
         logger.info(f"Categorized reporter initialized with output directory: {output_dir}")
     
+    def _open_handle(self, file_path: Path):
+        """Open a category file for appending and register its CSV writer"""
+        
+        handle = open(file_path, 'a', newline='', encoding='utf-8')
+        self._handles[file_path] = handle
+        self._writers[file_path] = csv.writer(handle)
+    
     def _initialize_csv_files(self):
         """Initialize CSV files with headers"""
         
@@ -102,10 +132,8 @@ class CategorizedReporter:
                 employee_id, pdf_path, processing_result, validation_result, catalog_data, category
             )
             
-            # Write to appropriate file
-            with open(output_file, 'a', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(row_data)
+            # Write to the appropriate file
+            self._write_row(output_file, row_data)
             
             logger.debug(f"Added {category} result for employee {employee_id}")
             
@@ -115,40 +143,60 @@ class CategorizedReporter:
             self._add_error_result(employee_id, pdf_path, str(e))
     
     def _extract_row_data(self, employee_id: str, pdf_path: str, processing_result: Any,
-                         validation_result: Any, catalog_data: Dict, category: str) -> List[str]:
+                         validation_result: Any, catalog_data: Dict, category: str,
+                         _basename=os.path.basename) -> List[str]:
         """Extract data for CSV row"""
         
         # Basic information
-        pdf_name = os.path.basename(pdf_path)
+        pdf_name = _basename(pdf_path)
         
         # Processing result data
-        if hasattr(processing_result, 'primary_i9_data') and processing_result.primary_i9_data:
-            i9_data = processing_result.primary_i9_data
-            first_name = getattr(i9_data, 'first_name', '')
-            last_name = getattr(i9_data, 'last_name', '')
-            citizenship_status = getattr(i9_data, 'citizenship_status', '')
-            employee_signature_date = getattr(i9_data, 'employee_signature_date', '')
+        i9_data = getattr(processing_result, 'primary_i9_data', None)
+        if i9_data:
+            try:
+                first_name, last_name, citizenship_status, employee_signature_date = _I9_ROW_ATTRS(i9_data)
+            except AttributeError:
+                first_name = getattr(i9_data, 'first_name', '')
+                last_name = getattr(i9_data, 'last_name', '')
+                citizenship_status = getattr(i9_data, 'citizenship_status', '')
+                employee_signature_date = getattr(i9_data, 'employee_signature_date', '')
         else:
             first_name = last_name = citizenship_status = employee_signature_date = ''
         
         # Validation data
         if validation_result:
-            validation_score = f"{validation_result.overall_score:.1f}%"
+            validation_score = format(validation_result.overall_score, '.1f') + '%'
             critical_issues = validation_result.critical_issues
+            error_issues = validation_result.error_issues
             total_validations = validation_result.total_issues
-            passed_validations = total_validations - validation_result.critical_issues - validation_result.error_issues
-            failed_validations = validation_result.critical_issues + validation_result.error_issues
-            document_matches = len(validation_result.document_matches) if validation_result.document_matches else 0
+            failed_validations = critical_issues + error_issues
+            passed_validations = total_validations - failed_validations
+            document_matches = validation_result.document_matches
+            document_matches = len(document_matches) if document_matches else 0
         else:
             validation_score = "N/A"
             critical_issues = total_validations = passed_validations = failed_validations = 0
             document_matches = 0
         
         # Processing metadata
-        total_forms = getattr(processing_result, 'total_forms_detected', 0)
-        form_type = getattr(processing_result, 'form_type_selected', '')
-        selection_reason = getattr(processing_result, 'selection_reason', '')
-        notes = getattr(processing_result, 'notes', '')
+        try:
+            (total_forms, form_type, selection_reason, notes,
+             document_matches_found, supporting_documents_count, expiration_matches,
+             documents_mentioned_count, documents_attached_count, documents_missing_count,
+             document_attachment_status) = _PROCESSING_RESULT_ATTRS(processing_result)
+        except AttributeError:
+            # Not a full ProcessingResult - fall back to per-attribute defaults
+            total_forms = getattr(processing_result, 'total_forms_detected', 0)
+            form_type = getattr(processing_result, 'form_type_selected', '')
+            selection_reason = getattr(processing_result, 'selection_reason', '')
+            notes = getattr(processing_result, 'notes', '')
+            document_matches_found = getattr(processing_result, 'document_matches_found', document_matches)
+            supporting_documents_count = getattr(processing_result, 'supporting_documents_count', 0)
+            expiration_matches = getattr(processing_result, 'expiration_matches', 0)
+            documents_mentioned_count = getattr(processing_result, 'documents_mentioned_count', 0)
+            documents_attached_count = getattr(processing_result, 'documents_attached_count', 0)
+            documents_missing_count = getattr(processing_result, 'documents_missing_count', 0)
+            document_attachment_status = getattr(processing_result, 'document_attachment_status', 'UNKNOWN')
         
         # Catalog data
         catalog_file_path = catalog_data.get('catalog_file_path', '') if catalog_data else ''
@@ -170,13 +218,13 @@ class CategorizedReporter:
             total_validations,
             passed_validations,
             failed_validations,
-            getattr(processing_result, 'document_matches_found', document_matches),  # document_matches_found
-            getattr(processing_result, 'supporting_documents_count', 0),  # supporting_documents_count
-            getattr(processing_result, 'expiration_matches', 0),  # expiration_matches ← FIXED!
-            getattr(processing_result, 'documents_mentioned_count', 0),  # documents_mentioned_count ← NEW!
-            getattr(processing_result, 'documents_attached_count', 0),  # documents_attached_count ← NEW!
-            getattr(processing_result, 'documents_missing_count', 0),  # documents_missing_count ← NEW!
-            getattr(processing_result, 'document_attachment_status', 'UNKNOWN'),  # document_attachment_status ← NEW!
+            document_matches_found,
+            supporting_documents_count,
+            expiration_matches,
+            documents_mentioned_count,
+            documents_attached_count,
+            documents_missing_count,
+            document_attachment_status,
             "Applied",  # business_rules_applied
             "",  # scenario_results
             "",  # validation_details
@@ -203,12 +251,36 @@ class CategorizedReporter:
             f"Error: {error_message}"
         ]
         
-        with open(self.error_file, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(row_data)
+        self._write_row(self.error_file, row_data)
         
         self.error_count += 1
     
+    def _write_row(self, output_file: Path, row_data: List[Any]):
+        """Write a row through the category file's open handle and flush it to disk"""
+        
+        with self._rows_lock:
+            # A row arriving after close() reopens the file rather than failing
+            if self._handles[output_file].closed:
+                self._open_handle(output_file)
+            self._writers[output_file].writerow(row_data)
+            self._handles[output_file].flush()
+    
+    def flush(self):
+        """Flush the category file handles"""
+        
+        with self._rows_lock:
+            for handle in self._handles.values():
+                if not handle.closed:
+                    handle.flush()
+    
+    def close(self):
+        """Flush and close the category file handles"""
+        
+        with self._rows_lock:
+            for handle in self._handles.values():
+                if not handle.closed:
+                    handle.close()
+    
     def get_summary(self) -> Dict[str, int]:
         """Get processing summary"""
         return {
@@ -221,6 +293,8 @@ class CategorizedReporter:
     def finalize(self):
         """Finalize reporting and log summary"""
         
+        self.close()
+        
         summary = self.get_summary()
         
         logger.info("=== Categorized Processing Summary ===")
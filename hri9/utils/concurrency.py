@@ -5,20 +5,123 @@ Concurrency utilities for the I-9 detection system.
 This module provides thread-safe resources for concurrent processing.
 """
 
+import io
 import os
+import hashlib
 import csv
+import operator
+import queue
 import threading
 import time
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, NamedTuple
 from datetime import datetime
 from ..utils.logging_config import logger
 from ..config import settings
 from ..catalog.cache import CatalogCache, CacheStatistics
+from ..utils.enhanced_reporting import EnhancedReporter
+
+try:
+    import xxhash
+except ImportError:
+    # xxhash is optional; fall back to an 8-byte BLAKE2b digest
+    xxhash = None
+
+
+def _pdf_fingerprint(pdf_path):
+    """64-bit fingerprint of a PDF path, stored instead of the path itself."""
+    data = os.fsencode(pdf_path)
+    if xxhash is not None:
+        return xxhash.xxh64_intdigest(data)
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'little')
+
+
+# Bloom filter sizing for the processed-PDF pre-check (8M bits = 1 MiB)
+_PDF_BLOOM_BITS = 1 << 23
+_PDF_BLOOM_MASK = _PDF_BLOOM_BITS - 1
+_PDF_BLOOM_PROBES = 7
+
+
+def _pdf_bloom_positions(fingerprint):
+    """Bit positions for a PDF fingerprint using Kirsch-Mitzenmacher double hashing."""
+    h = fingerprint
+    h1 = h & _PDF_BLOOM_MASK
+    h2 = (h >> 32) | 1
+    return [(h1 + i * h2) & _PDF_BLOOM_MASK for i in range(_PDF_BLOOM_PROBES)]
+
+
+# Queued by close() to stop the CSV writer thread
+_WRITER_STOP = object()
+
+# Standard CSV headers, without and with the catalog metric columns
+_STD_HEADERS = ('Employee ID', 'PDF File Name', 'I-9 Forms Found',
+                'Pages Removed', 'Success', 'Extracted I-9 Path')
+_STD_HEADERS_WITH_CATALOG = _STD_HEADERS + (
+    'Catalog Generated', 'Pages Cataloged', 'Catalog API Calls',
+    'Catalog Processing Time (s)', 'Catalog Cache Hits', 'Catalog Cache Misses'
+)
+
+# Catalog metric columns appended by write_csv_row_with_catalog_metrics
+_CATALOG_METRIC_KEYS = ('catalog_generated', 'pages_cataloged', 'api_calls_made',
+                        'processing_time', 'cache_hits', 'cache_misses')
+_CATALOG_METRICS = operator.itemgetter(*_CATALOG_METRIC_KEYS)
+_DEFAULT_CATALOG_METRICS = (False, 0, 0, 0.0, 0, 0)
+_DEFAULT_CATALOG_METRIC_MAP = dict(zip(_CATALOG_METRIC_KEYS, _DEFAULT_CATALOG_METRICS))
+
+_CATALOG_SUMMARY_TEMPLATE = """Catalog Processing Summary
+-------------------------
+Documents cataloged: {cataloged_documents}
+Pages cataloged: {cataloged_pages}
+API calls made: {catalog_api_calls}
+Total processing time: {catalog_processing_time:.2f} seconds
+Average pages per document: {avg_pages_per_document:.1f}
+Average processing time per document: {avg_processing_time_per_document:.2f} seconds
+
+Cache Statistics
+----------------
+Cache hits: {catalog_cache_hits}
+Cache misses: {catalog_cache_misses}
+Cache hit rate: {cache_hit_rate:.1f}%
+Memory usage: {cache_memory_usage_mb:.1f} MB
+Cache evictions: {cache_evictions}
+Cached documents: {cached_documents_count}"""
+
+_CATALOG_RATES_TEMPLATE = """
+
+Performance Metrics
+------------------
+Documents per second: {documents_per_second:.2f}
+Pages per second: {pages_per_second:.2f}
+API calls per second: {api_calls_per_second:.2f}"""
+
+# Cache figures reported as zero when no cache statistics are available
+_EMPTY_CACHE_SUMMARY = {'cache_memory_usage_mb': 0, 'cache_evictions': 0, 'cached_documents_count': 0}
+
+
+class CatalogProgress(NamedTuple):
+    """Raw catalog counters returned by SharedResources.update_catalog_progress."""
+    cataloged_documents: int
+    cataloged_pages: int
+    catalog_api_calls: int
+    catalog_processing_time: float
+
 
 class SharedResources:
     """Thread-safe shared resources for concurrent I9 detection processing."""
     
-    def __init__(self, csv_file_path=None, catalog_cache=None, use_enhanced_csv=True):
+    # Userspace write buffer for the CSV output file
+    CSV_BUFFER_SIZE = 1 << 20
+    
+    # Maximum number of queued rows written per writerows call
+    ROW_BUFFER_LIMIT = 256
+    
+    # Seconds a memory pressure check result is reused
+    MEMORY_PRESSURE_TTL = 1.0
+    
+    # Rows written between fsync calls when durable output is requested
+    DURABLE_SYNC_ROWS = 256
+    
+    def __init__(self, csv_file_path=None, catalog_cache=None, use_enhanced_csv=True,
+                 durable=False, cleanup_interval=60.0, cleanup_max_age=3600):
         """
         Initialize shared resources for concurrent processing.
         
@@ -26,11 +129,22 @@ class SharedResources:
             csv_file_path (str, optional): Path to CSV output file. Defaults to settings.OUTPUT_CSV.
             catalog_cache (CatalogCache, optional): Shared catalog cache instance.
             use_enhanced_csv (bool): Whether to use enhanced CSV format with catalog data.
+            durable (bool): Whether to fsync the CSV file every DURABLE_SYNC_ROWS rows
+                            instead of only once at close().
+            cleanup_interval (float, optional): Seconds between background catalog cache
+                                                cleanups. None disables the janitor.
+            cleanup_max_age (int): Maximum age in seconds of catalog entries kept by
+                                   the background cleanup.
         """
         self.csv_lock = threading.Lock()
         self.progress_lock = threading.Lock()
         self.pdf_lock = threading.Lock()
-        self.catalog_lock = threading.RLock()
+        # CatalogCache serializes its own state, so plain delegations to it take
+        # no outer lock; catalog_lock is only for callers composing several
+        # cache operations into one atomic step
+        self.catalog_lock = threading.Lock()
+        # Guards the catalog counters only
+        self._counter_lock = threading.Lock()
         
         # Original counters
         self.processed_count = 0
@@ -47,17 +161,55 @@ class SharedResources:
         self.catalog_processing_time = 0.0
         self.catalog_start_time = None
         
+        # get_catalog_statistics memo, invalidated by bumping _stats_version
+        self._stats_version = 0
+        self._stats_cache = None
+        
         # File handling
         self.csv_file_path = csv_file_path or settings.OUTPUT_CSV
+        self._csv_dir = os.path.dirname(self.csv_file_path)
         self.csv_file = None
         self.csv_writer = None
-        self.processed_pdfs = set()  # Track processed PDFs to avoid duplicates
+        # Track processed PDFs by 64-bit fingerprint rather than full path to
+        # bound memory; a Bloom filter in front gives a lock-free pre-check
+        self._processed_fp = set()
+        self._pdf_bloom = bytearray(_PDF_BLOOM_BITS >> 3)
+        
+        # Rows queued by workers and written in bulk by a single writer thread
+        self._row_queue = queue.SimpleQueue()
+        self._writer_thread = None
+        self.durable = durable
         
         # Catalog cache management
         self.catalog_cache = catalog_cache or CatalogCache()
-        self.catalog_enabled = True
+        self.catalog_enabled = True  # Also binds write_csv_row_with_catalog_metrics
         self.use_enhanced_csv = use_enhanced_csv
+        self._write_enhanced = EnhancedReporter.write_enhanced_csv_row
+        
+        # Background catalog cache cleanup, re-armed after every run
+        self.cleanup_interval = cleanup_interval
+        self.cleanup_max_age = cleanup_max_age
+        self._janitor = None
+        self._janitor_lock = threading.Lock()
+        
+        # (monotonic time, result) of the last memory pressure check
+        self._pressure_cache = (float('-inf'), False)
+        if cleanup_interval:
+            self._schedule_janitor()
         
+    @property
+    def catalog_enabled(self):
+        """Whether catalog processing and catalog CSV columns are enabled."""
+        return self._catalog_enabled
+    
+    @catalog_enabled.setter
+    def catalog_enabled(self, enabled):
+        self._catalog_enabled = enabled
+        # Specialize the per-row writer once instead of branching on every row
+        self.write_csv_row_with_catalog_metrics = (
+            self._write_with_catalog_metrics if enabled else self._write_without_catalog_metrics
+        )
+    
     def initialize_csv(self, headers=None, include_catalog_metrics=True):
         """
         Initialize CSV file and writer with specified headers.
@@ -68,32 +220,36 @@ class SharedResources:
         """
         try:
             # Ensure directory exists
-            os.makedirs(os.path.dirname(self.csv_file_path), exist_ok=True)
+            if self._csv_dir and not os.path.isdir(self._csv_dir):
+                os.makedirs(self._csv_dir, exist_ok=True)
             
             if self.use_enhanced_csv:
                 # Use enhanced CSV format
-                from ..utils.enhanced_reporting import EnhancedReporter
                 self.csv_file, self.csv_writer = EnhancedReporter.initialize_enhanced_csv(
                     self.csv_file_path, include_catalog_data=self.catalog_enabled
                 )
             else:
                 # Use original CSV format
                 if headers is None:
-                    headers = ['Employee ID', 'PDF File Name', 'I-9 Forms Found', 
-                              'Pages Removed', 'Success', 'Extracted I-9 Path']
-                    
                     # Add catalog metrics columns if enabled
-                    if include_catalog_metrics and self.catalog_enabled:
-                        headers.extend([
-                            'Catalog Generated', 'Pages Cataloged', 'Catalog API Calls',
-                            'Catalog Processing Time (s)', 'Catalog Cache Hits', 'Catalog Cache Misses'
-                        ])
+                    headers = (_STD_HEADERS_WITH_CATALOG if include_catalog_metrics and self.catalog_enabled
+                               else _STD_HEADERS)
                 
-                # Open file and initialize writer
-                self.csv_file = open(self.csv_file_path, 'w', newline='', encoding='utf-8')
+                # Open file and initialize writer: explicit raw/buffered/text layers
+                # so the large buffer sits directly on the file descriptor
+                raw_file = io.FileIO(self.csv_file_path, 'w')
+                buffered_file = io.BufferedWriter(raw_file, buffer_size=self.CSV_BUFFER_SIZE)
+                self.csv_file = io.TextIOWrapper(buffered_file, encoding='utf-8', newline='',
+                                                 write_through=False)
                 self.csv_writer = csv.writer(self.csv_file)
                 self.csv_writer.writerow(headers)
                 self.csv_file.flush()
+            
+            if self.csv_writer and self._writer_thread is None:
+                self._writer_thread = threading.Thread(
+                    target=self._drain_loop, name="csv-writer", daemon=True
+                )
+                self._writer_thread.start()
                 
             logger.info(f"Initialized {'enhanced' if self.use_enhanced_csv else 'standard'} CSV output at {self.csv_file_path}")
         except Exception as e:
@@ -103,16 +259,69 @@ class SharedResources:
         """
         Thread-safe CSV writing.
         
+        The row is queued without locking; the writer thread started by
+        initialize_csv() writes queued rows in batches.
+        
         Args:
             row_data (list): Row data to write to CSV.
         """
-        with self.csv_lock:
-            if self.csv_writer:
+        if self._writer_thread is not None:
+            self._row_queue.put(row_data)
+    
+    def _drain_loop(self):
+        """Writer thread: drain queued rows into the CSV file in batches."""
+        row_queue = self._row_queue
+        batch_limit = self.ROW_BUFFER_LIMIT
+        unsynced_rows = 0
+        running = True
+        
+        while running:
+            batch = []
+            waiters = []
+            item = row_queue.get()
+            while True:
+                if item is _WRITER_STOP:
+                    running = False
+                    break
+                if isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    batch.append(item)
+                if len(batch) >= batch_limit:
+                    break
+                try:
+                    item = row_queue.get_nowait()
+                except queue.Empty:
+                    break
+            
+            with self.csv_lock:
                 try:
-                    self.csv_writer.writerow(row_data)
-                    self.csv_file.flush()
+                    if batch:
+                        self.csv_writer.writerows(batch)
+                        unsynced_rows += len(batch)
+                    # The file buffer is only pushed to the OS when asked to,
+                    # or periodically with fsync for durable output
+                    if self.durable and unsynced_rows >= self.DURABLE_SYNC_ROWS:
+                        self.csv_file.flush()
+                        os.fsync(self.csv_file.fileno())
+                        unsynced_rows = 0
+                    elif waiters:
+                        self.csv_file.flush()
                 except Exception as e:
                     logger.error(f"Error writing to CSV: {e}")
+            
+            for waiter in waiters:
+                waiter.set()
+    
+    def flush(self):
+        """Block until every row queued so far has been written and flushed."""
+        writer_thread = self._writer_thread
+        if writer_thread is None or not writer_thread.is_alive():
+            return
+        
+        written = threading.Event()
+        self._row_queue.put(written)
+        written.wait()
     
     def update_progress(self, found_i9=False, removed_i9=False, extracted_i9=False):
         """
@@ -150,14 +359,23 @@ class SharedResources:
         """
         Check if a PDF has already been processed (thread-safe).
         
+        A Bloom filter answers the common "not processed" case without taking
+        pdf_lock; only a Bloom hit falls through to the locked set lookup.
+        
         Args:
             pdf_path (str): Path to PDF file.
             
         Returns:
             bool: True if PDF has been processed, False otherwise.
         """
+        fingerprint = _pdf_fingerprint(pdf_path)
+        bloom = self._pdf_bloom
+        for bit in _pdf_bloom_positions(fingerprint):
+            if not bloom[bit >> 3] & (1 << (bit & 7)):
+                return False
+        
         with self.pdf_lock:
-            return pdf_path in self.processed_pdfs
+            return fingerprint in self._processed_fp
     
     def mark_pdf_processed(self, pdf_path):
         """
@@ -166,12 +384,19 @@ class SharedResources:
         Args:
             pdf_path (str): Path to PDF file.
         """
+        fingerprint = _pdf_fingerprint(pdf_path)
+        positions = _pdf_bloom_positions(fingerprint)
+        bloom = self._pdf_bloom
+        # Bits are set under the lock: bytearray |= is a read-modify-write, and
+        # a lost bit would turn into a false "not processed" answer
         with self.pdf_lock:
-            self.processed_pdfs.add(pdf_path)
+            for bit in positions:
+                bloom[bit >> 3] |= 1 << (bit & 7)
+            self._processed_fp.add(fingerprint)
     
     def start_catalog_processing(self):
         """Mark the start of catalog processing for timing."""
-        with self.catalog_lock:
+        with self._counter_lock:
             self.catalog_start_time = time.time()
             logger.info("Started catalog processing phase")
     
@@ -187,55 +412,76 @@ class SharedResources:
             processing_time (float): Processing time in seconds.
             
         Returns:
-            dict: Current catalog progress statistics.
+            CatalogProgress: Current raw catalog counters. Call get_catalog_statistics()
+                             for the derived statistics.
         """
-        with self.catalog_lock:
+        with self._counter_lock:
             if document_cataloged:
                 self.cataloged_documents += 1
             self.cataloged_pages += pages_cataloged
             self.catalog_api_calls += api_calls_made
             self.catalog_processing_time += processing_time
-            
-            # Update cache statistics
-            if self.catalog_cache:
-                cache_stats = self.catalog_cache.get_statistics()
-                self.catalog_cache_hits = cache_stats.cache_hits
-                self.catalog_cache_misses = cache_stats.cache_misses
-            
-            return self.get_catalog_statistics()
+            self._stats_version += 1
+            return CatalogProgress(self.cataloged_documents, self.cataloged_pages,
+                                   self.catalog_api_calls, self.catalog_processing_time)
     
     def get_catalog_statistics(self):
         """
         Get current catalog statistics.
         
+        Counters are read once each without locking, so a snapshot taken while
+        workers are updating may be skewed by at most one in-flight update.
+        The counter-derived part is memoized until update_catalog_progress
+        bumps _stats_version or the cache hit/miss counts change; cache
+        statistics are read live from the CatalogCache at report time.
+        
         Returns:
             dict: Current catalog statistics.
         """
-        with self.catalog_lock:
-            stats = {
-                'cataloged_documents': self.cataloged_documents,
-                'cataloged_pages': self.cataloged_pages,
-                'catalog_api_calls': self.catalog_api_calls,
-                'catalog_processing_time': self.catalog_processing_time,
-                'catalog_cache_hits': self.catalog_cache_hits,
-                'catalog_cache_misses': self.catalog_cache_misses,
-                'avg_pages_per_document': (self.cataloged_pages / self.cataloged_documents 
-                                         if self.cataloged_documents > 0 else 0),
-                'avg_processing_time_per_document': (self.catalog_processing_time / self.cataloged_documents 
-                                                   if self.cataloged_documents > 0 else 0),
-                'cache_hit_rate': (self.catalog_cache_hits / (self.catalog_cache_hits + self.catalog_cache_misses) * 100
-                                 if (self.catalog_cache_hits + self.catalog_cache_misses) > 0 else 0)
-            }
-            
-            if self.catalog_cache:
-                cache_stats = self.catalog_cache.get_statistics()
-                stats.update({
-                    'cache_memory_usage_mb': cache_stats.memory_usage_bytes / (1024 * 1024),
-                    'cache_evictions': cache_stats.evictions,
-                    'cached_documents_count': cache_stats.total_documents
-                })
+        cache_stats = self.catalog_cache.get_statistics() if self.catalog_cache else None
+        return self._catalog_statistics(cache_stats)
+    
+    def _catalog_statistics(self, cache_stats: Optional[CacheStatistics]):
+        """Build the catalog statistics dict from an already fetched cache snapshot."""
+        if cache_stats is not None:
+            # Hits and misses are owned by the cache; mirror them for callers
+            # reading the attributes directly
+            self.catalog_cache_hits = cache_stats.cache_hits
+            self.catalog_cache_misses = cache_stats.cache_misses
+        cache_hits = self.catalog_cache_hits
+        cache_misses = self.catalog_cache_misses
+        
+        key = (self._stats_version, cache_hits, cache_misses)
+        cached = self._stats_cache
+        if cached is None or cached[0] != key:
+            documents = self.cataloged_documents
+            pages = self.cataloged_pages
+            processing_time = self.catalog_processing_time
+            cache_lookups = cache_hits + cache_misses
             
-            return stats
+            cached = self._stats_cache = (key, {
+                'cataloged_documents': documents,
+                'cataloged_pages': pages,
+                'catalog_api_calls': self.catalog_api_calls,
+                'catalog_processing_time': processing_time,
+                'catalog_cache_hits': cache_hits,
+                'catalog_cache_misses': cache_misses,
+                'avg_pages_per_document': pages / documents if documents > 0 else 0,
+                'avg_processing_time_per_document': processing_time / documents if documents > 0 else 0,
+                'cache_hit_rate': cache_hits / cache_lookups * 100 if cache_lookups > 0 else 0
+            })
+        
+        # Copy so callers cannot mutate the memoized snapshot
+        stats = dict(cached[1])
+        
+        if cache_stats is not None:
+            stats.update({
+                'cache_memory_usage_mb': cache_stats.memory_usage_bytes / (1024 * 1024),
+                'cache_evictions': cache_stats.evictions,
+                'cached_documents_count': cache_stats.total_documents
+            })
+        
+        return stats
     
     def store_document_catalog(self, document_id: str, catalog_entry) -> bool:
         """
@@ -250,18 +496,18 @@ class SharedResources:
         """
         if self.catalog_cache is None or not self.catalog_enabled:
             return False
-            
-        with self.catalog_lock:
-            try:
-                success = self.catalog_cache.store_document_catalog(document_id, catalog_entry)
-                if success:
-                    logger.debug(f"Stored catalog for document: {document_id}")
-                else:
-                    logger.warning(f"Failed to store catalog for document: {document_id}")
-                return success
-            except Exception as e:
-                logger.error(f"Error storing catalog for document {document_id}: {e}")
-                return False
+        
+        # CatalogCache is internally locked, so no outer lock is taken here
+        try:
+            success = self.catalog_cache.store_document_catalog(document_id, catalog_entry)
+            if success:
+                logger.debug(f"Stored catalog for document: {document_id}")
+            else:
+                logger.warning(f"Failed to store catalog for document: {document_id}")
+            return success
+        except Exception as e:
+            logger.error(f"Error storing catalog for document {document_id}: {e}")
+            return False
     
     def get_document_catalog(self, document_id: str):
         """
@@ -275,13 +521,12 @@ class SharedResources:
         """
         if self.catalog_cache is None or not self.catalog_enabled:
             return None
-            
-        with self.catalog_lock:
-            try:
-                return self.catalog_cache.get_document_catalog(document_id)
-            except Exception as e:
-                logger.error(f"Error retrieving catalog for document {document_id}: {e}")
-                return None
+        
+        try:
+            return self.catalog_cache.get_document_catalog(document_id)
+        except Exception as e:
+            logger.error(f"Error retrieving catalog for document {document_id}: {e}")
+            return None
     
     def get_page_analysis(self, document_id: str, page_number: int):
         """
@@ -296,13 +541,12 @@ class SharedResources:
         """
         if self.catalog_cache is None or not self.catalog_enabled:
             return None
-            
-        with self.catalog_lock:
-            try:
-                return self.catalog_cache.get_page_analysis(document_id, page_number)
-            except Exception as e:
-                logger.error(f"Error retrieving page analysis for document {document_id}, page {page_number}: {e}")
-                return None
+        
+        try:
+            return self.catalog_cache.get_page_analysis(document_id, page_number)
+        except Exception as e:
+            logger.error(f"Error retrieving page analysis for document {document_id}, page {page_number}: {e}")
+            return None
     
     def cleanup_catalog_cache(self, max_age_seconds: int = 3600) -> int:
         """
@@ -316,33 +560,55 @@ class SharedResources:
         """
         if self.catalog_cache is None or not self.catalog_enabled:
             return 0
-            
-        with self.catalog_lock:
-            try:
-                removed_count = self.catalog_cache.cleanup_old_entries(max_age_seconds)
-                if removed_count > 0:
-                    logger.info(f"Cleaned up {removed_count} old catalog entries")
-                return removed_count
-            except Exception as e:
-                logger.error(f"Error cleaning up catalog cache: {e}")
-                return 0
+        
+        try:
+            removed_count = self.catalog_cache.cleanup_old_entries(max_age_seconds)
+            if removed_count > 0:
+                logger.info(f"Cleaned up {removed_count} old catalog entries")
+            return removed_count
+        except Exception as e:
+            logger.error(f"Error cleaning up catalog cache: {e}")
+            return 0
+    
+    def _schedule_janitor(self):
+        """Arm the background cleanup timer. Caller holds _janitor_lock or is __init__."""
+        self._janitor = threading.Timer(self.cleanup_interval, self._janitor_tick)
+        self._janitor.daemon = True
+        self._janitor.start()
+    
+    def _janitor_tick(self):
+        """Timer callback: clean up old catalog entries, then re-arm."""
+        # CatalogCache locks internally, so this never blocks catalog updates
+        self.cleanup_catalog_cache(self.cleanup_max_age)
+        with self._janitor_lock:
+            if self._janitor is not None:
+                self._schedule_janitor()
     
     def is_catalog_memory_pressure(self) -> bool:
         """
         Check if catalog cache is under memory pressure.
         
+        Memory pressure changes slowly, so a result is reused for
+        MEMORY_PRESSURE_TTL seconds.
+        
         Returns:
             bool: True if under memory pressure, False otherwise.
         """
         if self.catalog_cache is None or not self.catalog_enabled:
             return False
-            
-        with self.catalog_lock:
-            try:
-                return self.catalog_cache.is_memory_pressure()
-            except Exception as e:
-                logger.error(f"Error checking catalog memory pressure: {e}")
-                return False
+        
+        now = time.monotonic()
+        checked_at, under_pressure = self._pressure_cache
+        if now - checked_at < self.MEMORY_PRESSURE_TTL:
+            return under_pressure
+        
+        try:
+            under_pressure = self.catalog_cache.is_memory_pressure()
+            self._pressure_cache = (now, under_pressure)
+            return under_pressure
+        except Exception as e:
+            logger.error(f"Error checking catalog memory pressure: {e}")
+            return False
     
     def get_catalog_cache_info(self) -> Dict[str, Any]:
         """
@@ -353,20 +619,19 @@ class SharedResources:
         """
         if self.catalog_cache is None or not self.catalog_enabled:
             return {'enabled': False}
-            
-        with self.catalog_lock:
-            try:
-                stats = self.catalog_cache.get_statistics()
-                return {
-                    'enabled': True,
-                    'statistics': stats.to_dict(),
-                    'memory_usage_mb': stats.memory_usage_bytes / (1024 * 1024),
-                    'cached_documents': len(self.catalog_cache),
-                    'memory_pressure': self.catalog_cache.is_memory_pressure()
-                }
-            except Exception as e:
-                logger.error(f"Error getting catalog cache info: {e}")
-                return {'enabled': True, 'error': str(e)}
+        
+        try:
+            stats = self.catalog_cache.get_statistics()
+            return {
+                'enabled': True,
+                'statistics': stats.to_dict(),
+                'memory_usage_mb': stats.memory_usage_bytes / (1024 * 1024),
+                'cached_documents': len(self.catalog_cache),
+                'memory_pressure': self.catalog_cache.is_memory_pressure()
+            }
+        except Exception as e:
+            logger.error(f"Error getting catalog cache info: {e}")
+            return {'enabled': True, 'error': str(e)}
     
     def write_enhanced_csv_row(self, base_data, catalog_entry=None, catalog_files=None):
         """
@@ -378,12 +643,11 @@ class SharedResources:
             catalog_files (dict): Paths to catalog files.
         """
         if self.use_enhanced_csv:
-            from ..utils.enhanced_reporting import EnhancedReporter
             # Log successful extraction
             logger.debug(f"Writing enhanced CSV row: catalog_entry={type(catalog_entry)}, has_pages={hasattr(catalog_entry, 'pages') if catalog_entry else False}")
             with self.csv_lock:
                 if self.csv_writer and self.csv_file:
-                    EnhancedReporter.write_enhanced_csv_row(
+                    self._write_enhanced(
                         self.csv_writer, self.csv_file, base_data, 
                         catalog_entry, catalog_files
                     )
@@ -404,28 +668,39 @@ class SharedResources:
         """
         Write a CSV row including catalog metrics.
         
+        Instances rebind this name to _write_with_catalog_metrics or
+        _write_without_catalog_metrics whenever catalog_enabled is set.
+        
         Args:
             base_row_data (list): Base row data (original columns).
             catalog_metrics (dict, optional): Catalog metrics for this document.
         """
-        row_data = list(base_row_data)
-        
-        # Add catalog metrics if enabled
         if self.catalog_enabled:
-            if catalog_metrics:
-                row_data.extend([
-                    catalog_metrics.get('catalog_generated', False),
-                    catalog_metrics.get('pages_cataloged', 0),
-                    catalog_metrics.get('api_calls_made', 0),
-                    round(catalog_metrics.get('processing_time', 0.0), 3),
-                    catalog_metrics.get('cache_hits', 0),
-                    catalog_metrics.get('cache_misses', 0)
-                ])
-            else:
-                # Default values when no catalog metrics available
-                row_data.extend([False, 0, 0, 0.0, 0, 0])
+            self._write_with_catalog_metrics(base_row_data, catalog_metrics)
+        else:
+            self._write_without_catalog_metrics(base_row_data, catalog_metrics)
+    
+    def _write_with_catalog_metrics(self, base_row_data, catalog_metrics=None):
+        """Write a row with the catalog metric columns appended."""
+        if catalog_metrics:
+            try:
+                (generated, pages, api_calls, processing_time,
+                 cache_hits, cache_misses) = _CATALOG_METRICS(catalog_metrics)
+            except KeyError:
+                # Partial metrics - overlay them on the defaults and fetch again
+                (generated, pages, api_calls, processing_time,
+                 cache_hits, cache_misses) = _CATALOG_METRICS({**_DEFAULT_CATALOG_METRIC_MAP,
+                                                               **catalog_metrics})
+            tail = (generated, pages, api_calls, round(processing_time, 3), cache_hits, cache_misses)
+        else:
+            # Default values when no catalog metrics available
+            tail = _DEFAULT_CATALOG_METRICS
         
-        self.write_csv_row(row_data)
+        self.write_csv_row([*base_row_data, *tail])
+    
+    def _write_without_catalog_metrics(self, base_row_data, catalog_metrics=None):
+        """Write a row without catalog columns."""
+        self.write_csv_row(base_row_data)
     
     def generate_catalog_summary(self) -> str:
         """
@@ -437,47 +712,38 @@ class SharedResources:
         if not self.catalog_enabled:
             return "Catalog processing: Disabled"
             
-        stats = self.get_catalog_statistics()
-        cache_info = self.get_catalog_cache_info()
+        # Fetch cache statistics once for the whole summary
+        cache_stats = self.catalog_cache.get_statistics() if self.catalog_cache else None
+        stats = {**_EMPTY_CACHE_SUMMARY, **self._catalog_statistics(cache_stats)}
+        summary = _CATALOG_SUMMARY_TEMPLATE.format_map(stats)
         
         total_time = time.time() - self.catalog_start_time if self.catalog_start_time else 0
         
-        summary_lines = [
-            "Catalog Processing Summary",
-            "-------------------------",
-            f"Documents cataloged: {stats['cataloged_documents']}",
-            f"Pages cataloged: {stats['cataloged_pages']}",
-            f"API calls made: {stats['catalog_api_calls']}",
-            f"Total processing time: {stats['catalog_processing_time']:.2f} seconds",
-            f"Average pages per document: {stats['avg_pages_per_document']:.1f}",
-            f"Average processing time per document: {stats['avg_processing_time_per_document']:.2f} seconds",
-            "",
-            "Cache Statistics",
-            "----------------",
-            f"Cache hits: {stats['catalog_cache_hits']}",
-            f"Cache misses: {stats['catalog_cache_misses']}",
-            f"Cache hit rate: {stats['cache_hit_rate']:.1f}%",
-            f"Memory usage: {stats.get('cache_memory_usage_mb', 0):.1f} MB",
-            f"Cache evictions: {stats.get('cache_evictions', 0)}",
-            f"Cached documents: {stats.get('cached_documents_count', 0)}"
-        ]
-        
         if total_time > 0:
-            summary_lines.extend([
-                "",
-                "Performance Metrics",
-                "------------------",
-                f"Documents per second: {stats['cataloged_documents'] / total_time:.2f}",
-                f"Pages per second: {stats['cataloged_pages'] / total_time:.2f}",
-                f"API calls per second: {stats['catalog_api_calls'] / total_time:.2f}"
-            ])
+            summary += _CATALOG_RATES_TEMPLATE.format_map({
+                'documents_per_second': stats['cataloged_documents'] / total_time,
+                'pages_per_second': stats['cataloged_pages'] / total_time,
+                'api_calls_per_second': stats['catalog_api_calls'] / total_time
+            })
         
-        return "\n".join(summary_lines)
+        return summary
     
     def close(self):
         """Close CSV file and clean up resources."""
-        if self.csv_file:
+        with self._janitor_lock:
+            if self._janitor is not None:
+                self._janitor.cancel()
+                self._janitor = None
+        
+        if self._writer_thread is not None:
+            self._row_queue.put(_WRITER_STOP)
+            self._writer_thread.join()
+            self._writer_thread = None
+        
+        if self.csv_file and not self.csv_file.closed:
             try:
+                self.csv_file.flush()
+                os.fsync(self.csv_file.fileno())
                 self.csv_file.close()
                 logger.info(f"Closed CSV output file: {self.csv_file_path}")
             except Exception as e:
@@ -7,14 +7,60 @@ and other criteria for debugging and selective processing.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 from ..utils.logging_config import logger
 from ..data.file_manager import FileManager
 
+# Pattern suggestions come from the first 20 employee IDs, top 5 kept
+_SUGGESTION_SCAN_LIMIT = 20
+_MAX_SUGGESTIONS = 5
+
+
+# PDF paths found by _resolve_pdf_path, keyed by (employee_id, use_local)
+_resolved_pdf_paths: Dict[Tuple[str, bool], str] = {}
+
+
+def _resolve_pdf_path(employee_id: str, use_local: bool) -> Optional[str]:
+    """
+    Resolve an employee's PDF path, sharing found paths across FileFilter methods.
+    
+    Only successful lookups are remembered, so an employee whose PDF was not
+    found is looked up again on the next call.
+    """
+    key = (employee_id, use_local)
+    pdf_path = _resolved_pdf_paths.get(key)
+    if pdf_path is None:
+        if use_local:
+            pdf_path = FileManager.get_pdf_from_local_sample(employee_id)
+        else:
+            pdf_path = FileManager.get_pdf_from_network_drive(employee_id)
+        if pdf_path:
+            _resolved_pdf_paths[key] = pdf_path
+    return pdf_path
+
+
+@lru_cache(maxsize=4096)
+def _catalog_file_names(pdf_path: str, catalog_output_dir: str) -> Tuple[str, str, str, str]:
+    """Catalog text/JSON file names and paths for a PDF, derived once per directory"""
+    original_filename = Path(pdf_path).stem
+    text_filename = f"{original_filename}.catalog.txt"
+    json_filename = f"{original_filename}.catalog.json"
+    return (text_filename, json_filename,
+            os.path.join(catalog_output_dir, text_filename),
+            os.path.join(catalog_output_dir, json_filename))
+
+
 class FileFilter:
     """Utility class for filtering files based on various criteria."""
     
+    @classmethod
+    def clear_caches(cls):
+        """Forget resolved PDF paths and catalog names (useful for testing or after the drive changes)."""
+        _resolved_pdf_paths.clear()
+        _catalog_file_names.cache_clear()
+    
     @staticmethod
     def filter_employees_by_pattern(employee_ids: List[str], pattern: str, 
                                    use_local: bool = False) -> List[str]:
@@ -32,31 +78,42 @@ class FileFilter:
         if not pattern:
             return employee_ids
         
+        return FileFilter._filter_with_suggestions(employee_ids, pattern, use_local)[0]
+    
+    @staticmethod
+    def _filter_with_suggestions(employee_ids: List[str], pattern: str,
+                                 use_local: bool = False) -> Tuple[List[str], List[str]]:
+        """
+        Filter employee IDs by pattern, collecting suggestions in the same pass.
+        
+        Suggestions are the first _MAX_SUGGESTIONS of the first
+        _SUGGESTION_SCAN_LIMIT employee IDs sharing any character with the pattern.
+        
+        Returns:
+            Tuple[List[str], List[str]]: (matching employee IDs, suggestions)
+        """
         logger.info(f"Filtering employees by pattern: '{pattern}'")
         
         filtered_ids = []
+        suggestions = []
         pattern_lower = pattern.lower()
+        pattern_chars = frozenset(pattern_lower)
         
-        for employee_id in employee_ids:
+        for index, employee_id in enumerate(employee_ids):
+            if (index < _SUGGESTION_SCAN_LIMIT and len(suggestions) < _MAX_SUGGESTIONS
+                    and not pattern_chars.isdisjoint(employee_id.lower())):
+                suggestions.append(employee_id)
+            
             try:
                 # Get the PDF path for this employee
-                if use_local:
-                    pdf_path = FileManager.get_pdf_from_local_sample(employee_id)
-                else:
-                    pdf_path = FileManager.get_pdf_from_network_drive(employee_id)
+                pdf_path = _resolve_pdf_path(employee_id, use_local)
                 
                 if not pdf_path:
                     continue
                 
-                # Check if pattern matches in various parts of the path
-                matches = [
-                    pattern_lower in employee_id.lower(),
-                    pattern_lower in os.path.basename(pdf_path).lower(),
-                    pattern_lower in os.path.dirname(pdf_path).lower(),
-                    pattern_lower in pdf_path.lower()
-                ]
-                
-                if any(matches):
+                # Check if pattern matches the employee ID or anywhere in the path
+                # (the file name and folder are both substrings of the full path)
+                if pattern_lower in employee_id.lower() or pattern_lower in pdf_path.lower():
                     filtered_ids.append(employee_id)
                     logger.debug(f"Employee {employee_id} matches pattern (file: {os.path.basename(pdf_path)})")
                 
@@ -71,7 +128,7 @@ class FileFilter:
         else:
             logger.warning(f"No employees matched pattern '{pattern}'. Available employees: {employee_ids[:5]}{'...' if len(employee_ids) > 5 else ''}")
         
-        return filtered_ids
+        return filtered_ids, suggestions
     
     @staticmethod
     def check_existing_catalog_files(employee_id: str, catalog_output_dir: str, 
@@ -89,21 +146,13 @@ class FileFilter:
         """
         try:
             # Get the PDF path to determine the base filename
-            if use_local:
-                pdf_path = FileManager.get_pdf_from_local_sample(employee_id)
-            else:
-                pdf_path = FileManager.get_pdf_from_network_drive(employee_id)
+            pdf_path = _resolve_pdf_path(employee_id, use_local)
             
             if not pdf_path:
                 return {'exists': False, 'text_path': None, 'json_path': None}
             
             # Generate expected catalog filenames
-            original_filename = Path(pdf_path).stem
-            text_filename = f"{original_filename}.catalog.txt"
-            json_filename = f"{original_filename}.catalog.json"
-            
-            text_path = os.path.join(catalog_output_dir, text_filename)
-            json_path = os.path.join(catalog_output_dir, json_filename)
+            _, _, text_path, json_path = _catalog_file_names(pdf_path, catalog_output_dir)
             
             text_exists = os.path.exists(text_path)
             json_exists = os.path.exists(json_path)
@@ -121,6 +170,45 @@ class FileFilter:
             logger.error(f"Error checking existing catalog files for {employee_id}: {e}")
             return {'exists': False, 'text_path': None, 'json_path': None}
     
+    @staticmethod
+    def _snapshot_catalog_dir(catalog_output_dir: str) -> Optional[Set[str]]:
+        """
+        List the catalog directory once for bulk existence checks.
+        
+        Args:
+            catalog_output_dir (str): Directory where catalog files are stored.
+            
+        Returns:
+            Optional[Set[str]]: Case-normalized entry names, an empty set if the
+                directory does not exist, or None if it could not be listed.
+        """
+        try:
+            with os.scandir(catalog_output_dir) as entries:
+                return {os.path.normcase(entry.name) for entry in entries}
+        except FileNotFoundError:
+            return set()
+        except OSError as e:
+            logger.warning(f"Could not list catalog directory {catalog_output_dir}: {e}")
+            return None
+    
+    @staticmethod
+    def _has_catalog_in_snapshot(employee_id: str, catalog_names: Set[str],
+                                 use_local: bool = False) -> bool:
+        """Check an employee's catalog files against a _snapshot_catalog_dir listing."""
+        try:
+            pdf_path = _resolve_pdf_path(employee_id, use_local)
+            
+            if not pdf_path:
+                return False
+            
+            original_filename = os.path.normcase(Path(pdf_path).stem)
+            return (f"{original_filename}.catalog.txt" in catalog_names or
+                    f"{original_filename}.catalog.json" in catalog_names)
+            
+        except Exception as e:
+            logger.error(f"Error checking existing catalog files for {employee_id}: {e}")
+            return False
+    
     @staticmethod
     def filter_employees_by_existing_catalogs(employee_ids: List[str], catalog_output_dir: str,
                                             skip_existing: bool = True, use_local: bool = False) -> List[str]:
@@ -145,12 +233,19 @@ class FileFilter:
         filtered_ids = []
         existing_count = 0
         
+        # One directory listing answers every employee; fall back to per-file checks
+        # if the directory cannot be listed
+        catalog_names = FileFilter._snapshot_catalog_dir(catalog_output_dir)
+        
         for employee_id in employee_ids:
-            catalog_status = FileFilter.check_existing_catalog_files(
-                employee_id, catalog_output_dir, use_local
-            )
-            
-            has_catalog = catalog_status['exists']
+            if catalog_names is None:
+                has_catalog = FileFilter.check_existing_catalog_files(
+                    employee_id, catalog_output_dir, use_local
+                )['exists']
+            else:
+                has_catalog = FileFilter._has_catalog_in_snapshot(
+                    employee_id, catalog_names, use_local
+                )
             
             if has_catalog:
                 existing_count += 1
@@ -183,21 +278,15 @@ class FileFilter:
         """
         try:
             # Get the PDF path to determine the base filename
-            if use_local:
-                pdf_path = FileManager.get_pdf_from_local_sample(employee_id)
-            else:
-                pdf_path = FileManager.get_pdf_from_network_drive(employee_id)
+            pdf_path = _resolve_pdf_path(employee_id, use_local)
             
             if not pdf_path:
                 return {'text_path': None, 'json_path': None}
             
             # Generate catalog filenames
-            original_filename = Path(pdf_path).stem
-            text_filename = f"{original_filename}.catalog.txt"
-            json_filename = f"{original_filename}.catalog.json"
-            
-            text_path = os.path.join(catalog_output_dir, text_filename)
-            json_path = os.path.join(catalog_output_dir, json_filename)
+            text_filename, json_filename, text_path, json_path = _catalog_file_names(
+                pdf_path, catalog_output_dir
+            )
             
             return {
                 'text_path': text_path,
@@ -232,8 +321,8 @@ class FileFilter:
                 'suggestions': []
             }
         
-        # Get matches
-        matches = FileFilter.filter_employees_by_pattern(employee_ids, pattern, use_local)
+        # Get matches, with suggestions gathered in the same pass
+        matches, suggestions = FileFilter._filter_with_suggestions(employee_ids, pattern, use_local)
         
         result = {
             'valid': len(matches) > 0,
@@ -244,15 +333,7 @@ class FileFilter:
         
         if len(matches) == 0:
             # Provide suggestions for similar patterns
-            suggestions = []
-            pattern_lower = pattern.lower()
-            
-            # Check for partial matches in employee IDs
-            for emp_id in employee_ids[:20]:  # Check first 20 for suggestions
-                if any(char in emp_id.lower() for char in pattern_lower):
-                    suggestions.append(emp_id)
-            
             result['error'] = f'No employees match pattern "{pattern}"'
-            result['suggestions'] = suggestions[:5]  # Top 5 suggestions
+            result['suggestions'] = suggestions
         
         return result
\ No newline at end of file
@@ -53,9 +53,7 @@ class RateLimiter:
             current_time = time.time()
             
             # Clean up old request times (older than 1 minute)
-            cutoff_time = current_time - 60.0
-            while self._request_times and self._request_times[0] < cutoff_time:
-                self._request_times.popleft()
+            self._prune_expired(current_time)
             
             # Calculate delays needed
             delay_for_rate_limit = self._calculate_rate_limit_delay(current_time)
@@ -75,6 +73,17 @@ class RateLimiter:
             
             return total_delay
     
+    def _prune_expired(self, current_time: float):
+        """
+        Drop request times older than one minute from the sliding window.
+        
+        Args:
+            current_time: Current timestamp
+        """
+        cutoff_time = current_time - 60.0
+        while self._request_times and self._request_times[0] < cutoff_time:
+            self._request_times.popleft()
+    
     def _calculate_rate_limit_delay(self, current_time: float) -> float:
         """
         Calculate delay needed to respect rate limit.
@@ -126,12 +135,9 @@ class RateLimiter:
             float: Current rate in requests per minute
         """
         with self._lock:
-            current_time = time.time()
-            cutoff_time = current_time - 60.0
-            
-            # Count requests in the last minute
-            recent_requests = sum(1 for t in self._request_times if t > cutoff_time)
-            return recent_requests
+            # After pruning, the window holds exactly the last minute's requests
+            self._prune_expired(time.time())
+            return len(self._request_times)
     
     def get_stats(self) -> dict:
         """
@@ -8,11 +8,17 @@ This module provides functionality for generating reports and statistics.
 import os
 import csv
 import time
+import atexit
+import threading
 from ..utils.logging_config import logger
 
 class Reporter:
     """Class for generating reports and statistics."""
     
+    # Open deletion CSVs by path: (csv_file, csv_writer), shared by worker threads
+    _deletion_handles = {}
+    _deletion_lock = threading.Lock()
+    
     @staticmethod
     def initialize_csv(csv_path, headers=None):
         """
@@ -140,11 +146,15 @@ class Reporter:
         
         return last_report_time, last_report_count
         
-    @staticmethod
-    def write_deletion_record(csv_path, employee_id, employee_name, file_path):
+    @classmethod
+    def write_deletion_record(cls, csv_path, employee_id, employee_name, file_path):
         """
         Write a record to the deletion CSV file.
         
+        The file is opened once per path and kept open until
+        close_deletion_records() runs (registered at exit); each record is
+        flushed as it is written.
+        
         Args:
             csv_path (str): Path to the deletion CSV file.
             employee_id (str): Employee ID.
@@ -155,23 +165,31 @@ class Reporter:
             bool: True if successful, False otherwise.
         """
         try:
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(csv_path), exist_ok=True)
-            
-            # Check if file exists to determine if we need to write headers
-            file_exists = os.path.isfile(csv_path)
-            
-            # Open file in append mode
-            with open(csv_path, 'a', newline='', encoding='utf-8') as csv_file:
-                csv_writer = csv.writer(csv_file)
+            with cls._deletion_lock:
+                handle = cls._deletion_handles.get(csv_path)
+                if handle is None:
+                    # Create directory if it doesn't exist
+                    os.makedirs(os.path.dirname(csv_path), exist_ok=True)
+                    
+                    # Check if file exists to determine if we need to write headers
+                    file_exists = os.path.isfile(csv_path)
+                    
+                    # Open file in append mode
+                    csv_file = open(csv_path, 'a', newline='', encoding='utf-8')
+                    csv_writer = csv.writer(csv_file)
+                    
+                    # Write headers if file is new
+                    if not file_exists:
+                        csv_writer.writerow(['Employee ID', 'Employee Name', 'File Path', 'Timestamp'])
+                    
+                    handle = cls._deletion_handles[csv_path] = (csv_file, csv_writer)
                 
-                # Write headers if file is new
-                if not file_exists:
-                    csv_writer.writerow(['Employee ID', 'Employee Name', 'File Path', 'Timestamp'])
+                csv_file, csv_writer = handle
                 
                 # Write the deletion record
                 timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
                 csv_writer.writerow([employee_id, employee_name, file_path, timestamp])
+                csv_file.flush()
             
             logger.info(f"Recorded file for deletion: {file_path}")
             return True
@@ -179,3 +197,18 @@ class Reporter:
         except Exception as e:
             logger.error(f"Error writing deletion record: {e}")
             return False
+    
+    @classmethod
+    def close_deletion_records(cls):
+        """Close every deletion CSV opened by write_deletion_record."""
+        with cls._deletion_lock:
+            handles, cls._deletion_handles = cls._deletion_handles, {}
+        
+        for csv_file, _ in handles.values():
+            try:
+                csv_file.close()
+            except Exception as e:
+                logger.error(f"Error closing deletion CSV: {e}")
+
+
+atexit.register(Reporter.close_deletion_records)